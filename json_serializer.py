@@ -5,6 +5,12 @@ from tkinter import filedialog, messagebox
 import re
 from json_validator import repair_scheduler_json_object, validate_json_structure
 
+# orjson is optional; it serializes much faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 # Default file name for saving and loading
 DEFAULT_SAVE_FILE = "hockey_scheduler_data.json"
@@ -23,6 +29,19 @@ class DateTimeEncoder(json.JSONEncoder):
             return obj.isoformat()
         return super().default(obj)
 
+def _write_json_file(file_path, data):
+    """Serialize data in one pass and write it to file_path with a single write."""
+    if ORJSON_AVAILABLE:
+        # orjson handles date/datetime/time natively and returns UTF-8 bytes
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+        with open(file_path, 'wb') as f:
+            f.write(payload)
+    else:
+        # Match orjson's output byte for byte (2-space indent, raw UTF-8, LF
+        # newlines) so saved files don't depend on whether orjson is installed
+        with open(file_path, 'w', encoding='utf-8', newline='') as f:
+            f.write(json.dumps(data, cls=DateTimeEncoder, indent=2, ensure_ascii=False))
+
 def normalize_preferred_days_and_times(data):
     if not isinstance(data, dict):
         return {}
@@ -75,8 +94,7 @@ def save_all_data(data):
         if not file_path:
             return False, None
             
-        with open(file_path, 'w') as f:
-            json.dump(data, f, cls=DateTimeEncoder, indent=4)
+        _write_json_file(file_path, data)
         
         _last_save_path = file_path
         return True, file_path
@@ -88,8 +106,7 @@ def save_all_data_to_path(data, file_path):
     """Saves all application data to a specific file path (for auto-save)."""
     global _last_save_path
     try:
-        with open(file_path, 'w') as f:
-            json.dump(data, f, cls=DateTimeEncoder, indent=4)
+        _write_json_file(file_path, data)
         
         _last_save_path = file_path
         return True
@@ -5,6 +5,7 @@ from ui.main_ui import HockeySchedulerUI
 from ui.scheduling_rules_tab import SchedulingRulesWindow
 import os
 import importlib
+import multiprocessing
 import sys
 
 # Try to import optional components
@@ -47,6 +48,8 @@ class MainApplication(tk.Tk):
             }
         }
         self.schedule_data = []
+        # Bumped whenever schedule_data changes so consumers can cache renders
+        self.schedule_version = 0
         
         # Auto-save tracking
         self.current_save_file = None  # Path to currently loaded/saved file
@@ -200,9 +203,7 @@ class MainApplication(tk.Tk):
         }
         
         # Use a modified version of the save function that doesn't prompt for file path
-        import json
-        with open(file_path, 'w') as f:
-            json.dump(data_to_save, f, cls=json_serializer.DateTimeEncoder, indent=4)
+        json_serializer.save_all_data_to_path(data_to_save, file_path)
             
         if not silent:
             messagebox.showinfo("Save Data", "All data saved successfully!")
@@ -298,6 +299,7 @@ class MainApplication(tk.Tk):
     def on_scheduler_updated(self, scheduler_data):
         """Callback for when scheduler data is updated."""
         self.schedule_data = scheduler_data.get('schedule', [])
+        self.schedule_version += 1
         self.on_data_changed("scheduler")
         # Update analytics dashboard if it's open
         self.update_analytics_dashboard()
@@ -323,6 +325,7 @@ class MainApplication(tk.Tk):
             # Store the schedule data
             if generated_schedule and 'schedule' in generated_schedule:
                 self.schedule_data = generated_schedule['schedule']
+                self.schedule_version += 1
                 self.on_data_changed("scheduler")
                 
                 # Update analytics dashboard if it's open
@@ -363,5 +366,8 @@ class MainApplication(tk.Tk):
 
 
 if __name__ == "__main__":
+    # The web sharing server runs in a spawned child process; in the frozen
+    # exe the child must stop here instead of opening another main window
+    multiprocessing.freeze_support()
     app = MainApplication()
     app.mainloop()
\ No newline at end of file
@@ -13,25 +13,66 @@ class HockeySchedulerUI(ttk.Frame):
         self.notebook = ttk.Notebook(self)
         self.notebook.pack(padx=10, pady=10, fill="both", expand=True)
         
-        # Create tabs
-        self.teams_tab = TeamTab(self.notebook, self.main_app)
-        self.notebook.add(self.teams_tab, text="Team Management")
-        
-        self.arena_tab = ArenaTab(self.notebook, self.main_app)
-        self.notebook.add(self.arena_tab, text="Arena & Availability")
-        
-        self.scheduler_tab = SchedulerTab(self.notebook, self.main_app)
-        self.notebook.add(self.scheduler_tab, text="Scheduler")
-        
-        # Add the calendar view tab
-        self.calendar_tab = CalendarViewTab(self.notebook, self.main_app)
-        self.notebook.add(self.calendar_tab, text="Calendar View")
+        # Create tabs. Each notebook page starts as an empty placeholder and
+        # the real tab is only built when it is first shown or accessed
+        # through its property (e.g. to load or collect data).
+        self._tab_classes = {
+            "teams_tab": TeamTab,
+            "arena_tab": ArenaTab,
+            "scheduler_tab": SchedulerTab,
+            "calendar_tab": CalendarViewTab,
+        }
+        self._tab_pages = {}
+        self._page_tabs = {}
+        self._built_tabs = {}
+        for attr, text in (("teams_tab", "Team Management"),
+                           ("arena_tab", "Arena & Availability"),
+                           ("scheduler_tab", "Scheduler"),
+                           ("calendar_tab", "Calendar View")):
+            page = ttk.Frame(self.notebook)
+            self.notebook.add(page, text=text)
+            self._tab_pages[attr] = page
+            self._page_tabs[str(page)] = attr
         
         # Bind tab change event to sync data between tabs
         self.notebook.bind("<<NotebookTabChanged>>", self.on_tab_changed)
         
+        # Build the initially selected tab right away
+        self._build_selected_tab()
+        
+    def _get_tab(self, attr):
+        """Return the tab for attr, building it on first use."""
+        tab = self._built_tabs.get(attr)
+        if tab is None:
+            tab = self._tab_classes[attr](self._tab_pages[attr], self.main_app)
+            tab.pack(fill="both", expand=True)
+            self._built_tabs[attr] = tab
+        return tab
+    
+    @property
+    def teams_tab(self):
+        return self._get_tab("teams_tab")
+    
+    @property
+    def arena_tab(self):
+        return self._get_tab("arena_tab")
+    
+    @property
+    def scheduler_tab(self):
+        return self._get_tab("scheduler_tab")
+    
+    @property
+    def calendar_tab(self):
+        return self._get_tab("calendar_tab")
+    
+    def _build_selected_tab(self):
+        attr = self._page_tabs.get(self.notebook.select())
+        if attr:
+            self._get_tab(attr)
+        
     def on_tab_changed(self, event):
         """Handle tab change events to sync data between tabs."""
+        self._build_selected_tab()
         try:
             selected_tab = event.widget.tab('current')['text']
             
@@ -630,8 +630,9 @@ class SchedulerTab(ttk.Frame):
                 return
 
             with open(file_path, 'w', newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow(["Team", "Opponent", "Arena", "Date", "Start", "End", "Type"])
+                fieldnames = ["team", "opponent", "arena", "date", "start", "end", "type"]
+                writer = csv.DictWriter(f, fieldnames=fieldnames, restval="", extrasaction="ignore")
+                writer.writerow(dict(zip(fieldnames, ["Team", "Opponent", "Arena", "Date", "Start", "End", "Type"])))
                 for event in self.schedule_data:
                     time_slot = event.get("time_slot", "")
                     start, end = ("", "")
@@ -644,15 +645,8 @@ class SchedulerTab(ttk.Frame):
                             # If parsing fails, just keep original values
                             start, end = parts
 
-                    writer.writerow([
-                        event.get("team", ""),
-                        event.get("opponent", ""),
-                        event.get("arena", ""),
-                        event.get("date", ""),
-                        start,
-                        end,
-                        event.get("type", "")
-                    ])
+                    # Missing keys fall back to restval and unrelated ones are ignored
+                    writer.writerow({**event, "start": start, "end": end})
 
             messagebox.showinfo("Success", "Schedule exported to CSV successfully!")
         except Exception as e:
@@ -2,6 +2,11 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import json
 import re
+from collections import defaultdict
+
+# Choices offered by the rule editor dialog
+_TEAM_TYPES = ("house", "competitive")
+_AGE_LABELS = tuple(f"U{i}" for i in range(7, 19))
 
 class SchedulingRulesWindow(tk.Toplevel):
     def __init__(self, parent, rules_data):
@@ -12,11 +17,29 @@ class SchedulingRulesWindow(tk.Toplevel):
         self.geometry("700x500")
         self.parent = parent
         self.rules = rules_data
+        # Python-side copy of every row as (type, age, tuple of ints) keyed by
+        # Treeview iid, so saving never has to read values back out of Tk.
+        self._rule_rows = {}
+        # Display order of every rule iid. Only the slice starting at
+        # _view_start that fits in the tree is actually inserted into Tk.
+        self._all_rules = []
+        self._view_start = 0
+        self._next_rule_id = 0
+        # iid of the selected rule; kept while it is scrolled out of the
+        # slice and re-selected when it comes back into view.
+        self._selected_rule = None
+        # Pending after() id for the debounced selection handler
+        self._pending_select = None
         
         self.setup_ui()
         self.load_rules(self.rules)
     
     def setup_ui(self):
+        # (top of first row, row height, border) until a drawn row can be
+        # measured; assume the headings are one row tall
+        row_height = int(ttk.Style(self).lookup("Treeview", "rowheight") or 20)
+        self._row_metrics = (row_height, row_height, 0)
+
         main_frame = ttk.LabelFrame(self, text="Default Scheduling Rules", padding=10)
         main_frame.pack(fill="both", expand=True, padx=10, pady=10)
         
@@ -37,9 +60,17 @@ class SchedulingRulesWindow(tk.Toplevel):
             self.times_tree.column(col, width=150, anchor='center')
         self.times_tree.pack(side="left", fill="both", expand=True)
         
-        scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.times_tree.yview)
-        scrollbar.pack(side="right", fill="y")
-        self.times_tree.configure(yscrollcommand=scrollbar.set)
+        # The scrollbar drives which rows are materialized rather than
+        # scrolling the tree itself; see _refresh_view.
+        self.times_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self._on_scrollbar)
+        self.times_scrollbar.pack(side="right", fill="y")
+        self.times_tree.bind("<Configure>", self._refresh_view)
+        self.times_tree.bind("<MouseWheel>", self._on_mousewheel)
+        self.times_tree.bind("<Button-4>", self._on_mousewheel)
+        self.times_tree.bind("<Button-5>", self._on_mousewheel)
+        self.times_tree.bind("<Up>", lambda event: self._on_arrow_key(-1))
+        self.times_tree.bind("<Down>", lambda event: self._on_arrow_key(1))
+        self.times_tree.bind("<<TreeviewSelect>>", self._on_rule_select)
         
         # Action buttons
         button_frame = ttk.Frame(times_frame)
@@ -69,22 +100,27 @@ class SchedulingRulesWindow(tk.Toplevel):
         self.edit_rule_dialog()
         
     def edit_selected_rule(self):
-        selected_item = self.times_tree.focus()
+        self._sync_selected_rule()  # don't wait for a pending debounced update
+        selected_item = self._selected_rule
         if not selected_item:
             messagebox.showerror("Error", "Please select a rule to edit.")
             return
         
-        values = self.times_tree.item(selected_item, 'values')
+        values = self._display_values(self._rule_rows[selected_item])
         self.edit_rule_dialog(values, selected_item)
         
     def delete_selected_rule(self):
-        selected_item = self.times_tree.focus()
+        self._sync_selected_rule()  # don't wait for a pending debounced update
+        selected_item = self._selected_rule
         if not selected_item:
             messagebox.showerror("Error", "Please select a rule to delete.")
             return
 
         if messagebox.askyesno("Delete Rule", "Are you sure you want to delete this rule?"):
-            self.times_tree.delete(selected_item)
+            self._rule_rows.pop(selected_item, None)
+            self._all_rules.remove(selected_item)
+            self._selected_rule = None
+            self._refresh_view()
             messagebox.showinfo("Success", "Rule deleted.")
 
     def edit_rule_dialog(self, initial_values=None, item=None):
@@ -100,13 +136,13 @@ class SchedulingRulesWindow(tk.Toplevel):
         # Team Type
         ttk.Label(frame, text="Team Type:").grid(row=0, column=0, padx=5, pady=5, sticky="w")
         type_var = tk.StringVar()
-        type_dropdown = ttk.Combobox(frame, textvariable=type_var, values=["house", "competitive"], state="readonly")
+        type_dropdown = ttk.Combobox(frame, textvariable=type_var, values=_TEAM_TYPES, state="readonly")
         type_dropdown.grid(row=0, column=1, padx=5, pady=5, sticky="ew")
 
         # Age Group
         ttk.Label(frame, text="Age Group:").grid(row=1, column=0, padx=5, pady=5, sticky="w")
         age_var = tk.StringVar()
-        age_dropdown = ttk.Combobox(frame, textvariable=age_var, values=[f"U{i}" for i in range(7, 19)], state="readonly")
+        age_dropdown = ttk.Combobox(frame, textvariable=age_var, values=_AGE_LABELS, state="readonly")
         age_dropdown.grid(row=1, column=1, padx=5, pady=5, sticky="ew")
         
         # Ice Times
@@ -128,10 +164,19 @@ class SchedulingRulesWindow(tk.Toplevel):
                 messagebox.showerror("Invalid Input", "Please fill out all fields with valid data.")
                 return
 
+            # The pattern above guarantees comma-separated digits, and int()
+            # ignores the surrounding whitespace, so one split is enough.
+            times = tuple(map(int, times_str.split(',')))
+            row = (team_type, age_level, times)
             if item:
-                self.times_tree.item(item, values=(team_type, age_level, times_str))
+                self._rule_rows[item] = row
+                if self.times_tree.exists(item):
+                    self.times_tree.item(item, values=self._display_values(row), tags=(team_type,))
             else:
-                self.times_tree.insert("", "end", values=(team_type, age_level, times_str), tags=(team_type,))
+                # Select the new rule and scroll so it is in view
+                self._selected_rule = self._add_rule_row(row)
+                self._view_start = len(self._all_rules)
+                self._refresh_view()
             dialog.destroy()
 
         button_frame = ttk.Frame(dialog)
@@ -142,6 +187,147 @@ class SchedulingRulesWindow(tk.Toplevel):
         dialog.columnconfigure(0, weight=1)
         dialog.rowconfigure(0, weight=1)
 
+    def _add_rule_row(self, row):
+        """Record a rule row; it is inserted into the tree once it is in view."""
+        item = f"rule{self._next_rule_id}"
+        self._next_rule_id += 1
+        self._rule_rows[item] = row
+        self._all_rules.append(item)
+        return item
+
+    @staticmethod
+    def _display_values(row):
+        """Format a (type, age, times) rule row as Treeview column values."""
+        team_type, age_level, times = row
+        return (team_type, age_level, ", ".join(str(t) for t in times))
+
+    def _visible_row_count(self):
+        """Number of whole rows that fit in the tree's current height.
+
+        A partly visible extra row would let the tree scroll by itself and
+        drift out of step with the scrollbar.
+        """
+        top, row_height, border = self._row_metrics
+        height = self.times_tree.winfo_height() - top - border
+        return max(1, height // row_height)
+
+    def _measure_rows(self):
+        """Measure row height and heading height from the first shown row.
+
+        Both depend on font, DPI and theme. Returns True if they changed.
+        """
+        children = self.times_tree.get_children()
+        bbox = self.times_tree.bbox(children[0]) if children else ""
+        if not bbox:
+            return False
+        x, y, _, height = bbox
+        # The row's x offset is the tree's border, which also sits below the last row
+        metrics = (y, height, x)
+        changed = metrics != self._row_metrics
+        self._row_metrics = metrics
+        return changed
+
+    def _refresh_view(self, event=None):
+        """Insert the rows in view and delete the ones scrolled out of it."""
+        total = len(self._all_rules)
+        count = self._visible_row_count()
+        start = max(0, min(self._view_start, total - count))
+        self._view_start = start
+        wanted = self._all_rules[start:start + count]
+        wanted_set = set(wanted)
+
+        stale = [item for item in self.times_tree.get_children() if item not in wanted_set]
+        if stale:
+            self.times_tree.delete(*stale)
+
+        # Rows kept on screen are already in order, so each missing row
+        # goes in at its position within the slice.
+        shown = set(self.times_tree.get_children())
+        insert = self.times_tree.insert
+        rule_rows = self._rule_rows
+        display_values = self._display_values
+        for index, item in enumerate(wanted):
+            if item not in shown:
+                row = rule_rows[item]
+                insert("", index, iid=item, values=display_values(row), tags=(row[0],))
+
+        # Keep the tree itself unscrolled; the slice does the scrolling
+        self.times_tree.yview_moveto(0)
+
+        # Deleting a row drops its selection, so restore it once it is back in view
+        selected = self._selected_rule
+        if selected in wanted_set and self.times_tree.selection() != (selected,):
+            self.times_tree.selection_set(selected)
+            self.times_tree.focus(selected)
+
+        if total:
+            self.times_scrollbar.set(start / total, (start + len(wanted)) / total)
+        else:
+            self.times_scrollbar.set(0.0, 1.0)
+
+        # Rows are only measurable once drawn; re-slice if the real geometry
+        # differs from what this pass assumed
+        if wanted:
+            self.after_idle(self._remeasure_rows)
+
+    def _remeasure_rows(self):
+        if self.winfo_exists() and self._measure_rows():
+            self._refresh_view()
+
+    def _on_scrollbar(self, *args):
+        if args[0] == "moveto":
+            self._view_start = int(float(args[1]) * len(self._all_rules))
+        elif args[0] == "scroll":
+            step = int(args[1])
+            if args[2] == "pages":
+                step *= self._visible_row_count()
+            self._view_start += step
+        self._refresh_view()
+
+    def _on_mousewheel(self, event):
+        # Handle mouse wheel scrolling. Windows reports multiples of 120 but
+        # macOS reports small deltas, so always move at least one row.
+        if event.delta:
+            step = int(-event.delta / 120) or (-1 if event.delta > 0 else 1)
+            self._on_scrollbar("scroll", step, "units")
+        elif event.num == 4:
+            self._on_scrollbar("scroll", -1, "units")
+        elif event.num == 5:
+            self._on_scrollbar("scroll", 1, "units")
+        return "break"
+
+    def _on_arrow_key(self, step):
+        """Scroll the slice when Up/Down would move the focus past its edge."""
+        focus = self.times_tree.focus()
+        children = self.times_tree.get_children()
+        if not focus or focus != (children[0] if step < 0 else children[-1]):
+            return None  # inside the slice; the Treeview moves the focus itself
+        index = self._all_rules.index(focus) + step
+        if not 0 <= index < len(self._all_rules):
+            return "break"
+        self._selected_rule = self._all_rules[index]
+        self._view_start += step
+        self._refresh_view()
+        return "break"
+
+    def _on_rule_select(self, event=None):
+        # Coalesce bursts of selection events (e.g. arrow-key repeat) into one update
+        if self._pending_select:
+            self.after_cancel(self._pending_select)
+        self._pending_select = self.after(20, self._sync_selected_rule)
+
+    def _sync_selected_rule(self):
+        """Record which rule Edit/Delete act on."""
+        self._pending_select = None
+        if not self.winfo_exists():
+            return
+        selection = self.times_tree.selection()
+        if selection:
+            self._selected_rule = selection[0]
+        elif self._selected_rule is not None and self.times_tree.exists(self._selected_rule):
+            # Deselected by the user, not just scrolled out of the slice
+            self._selected_rule = None
+
     def get_rules(self):
         return self.rules
 
@@ -150,21 +336,14 @@ class SchedulingRulesWindow(tk.Toplevel):
         self.rules['default_ice_time_type'] = self.default_type_var.get()
         
         # Save ice times per week
-        ice_times_per_week = {}
-        for item in self.times_tree.get_children():
-            team_type, age_level, times_str = self.times_tree.item(item, 'values')
-            
-            times = [t.strip() for t in times_str.split(',') if t.strip()]
-
-            if team_type not in ice_times_per_week:
-                ice_times_per_week[team_type] = {}
-            
+        ice_times_per_week = defaultdict(dict)
+        for team_type, age_level, times in self._rule_rows.values():
             # The JSON file structure requires the age group to be a key and the value to be a number.
             # We'll save the first number from the list, since only one ice time is expected per rule.
-            # I've updated the logic to handle this correctly.
-            ice_times_per_week[team_type][age_level] = int(times[0]) if times else 0
+            ice_times_per_week[team_type][age_level] = times[0] if times else 0
         
-        self.rules['ice_times_per_week'] = ice_times_per_week
+        # Only the outer mapping is a defaultdict; the per-type dicts are plain already
+        self.rules['ice_times_per_week'] = dict(ice_times_per_week)
         
         messagebox.showinfo("Success", "Scheduling rules have been updated.")
         self.destroy()
@@ -175,12 +354,20 @@ class SchedulingRulesWindow(tk.Toplevel):
         self.default_type_var.set(rules.get('default_ice_time_type', 'practice'))
         
         # Load ice times per week
-        for item in self.times_tree.get_children():
-            self.times_tree.delete(item)
+        children = self.times_tree.get_children()
+        if children:
+            self.times_tree.delete(*children)
+        self._rule_rows.clear()
+        self._all_rules.clear()
+        self._view_start = 0
+        self._selected_rule = None
         
         ice_times = rules.get('ice_times_per_week', {})
+        add_rule_row = self._add_rule_row
         for team_type, age_data in ice_times.items():
             for age_level, times_value in age_data.items():
-                # The JSON data has an integer, so we'll convert it to a string for display.
-                times_str = str(times_value)
-                self.times_tree.insert("", "end", values=(team_type, age_level, times_str), tags=(team_type,))
+                # Rules files may hold the count as a string; rows always keep ints
+                # so they are saved back as numbers. Formatting happens on display.
+                add_rule_row((team_type, age_level, (int(times_value),)))
+        
+        self._refresh_view()
@@ -1,9 +1,80 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
 import re
-from tkcalendar import DateEntry
+from collections import namedtuple
 from scheduler_logic import normalize_team_info
 
+# Late cutoff (HH:MM) and preferred time window (HH:MM-HH:MM) formats
+_HHMM_RE = re.compile(r"^([01]?\d|2[0-3]):[0-5]\d$")
+_HHMM_RANGE_RE = re.compile(r"^([01]?\d|2[0-3]):[0-5]\d\s*-\s*([01]?\d|2[0-3]):[0-5]\d$")
+
+# Widgets making up one row of the "Preferred Days & Times" grid
+DayWidgets = namedtuple("DayWidgets", "var entry strict")
+
+# Team list columns; any column not in _COL_WIDTHS is 90px wide
+_HEADINGS = ("Name", "Age", "Type", "Practice Min", "Game Min", "Shared",
+             "Mandatory Shared", "Strict Pref", "Late Cutoff", "Preferred", "Blackouts")
+_COL_WIDTHS = {"Preferred": 110, "Blackouts": 110, "Mandatory Shared": 100}
+_YES, _NO = "Yes", "No"
+
+
+def _parse_minutes(txt):
+    try:
+        return int(txt)
+    except ValueError:
+        raise ValueError("Duration must be an integer number of minutes.")
+
+
+def build_team_record(name, age, ttype, practice_txt, game_txt, allow_multiple,
+                      allow_shared, mandatory_shared, late_enabled, late_time,
+                      preferred_entries, blackouts):
+    """Validate raw form values and return a normalized (name, team) pair.
+
+    preferred_entries holds (day, time_text, strict) for each checked day.
+    Raises ValueError with a user-facing message on invalid input.
+    """
+    name = name.strip()
+    age = age.strip()
+    if not name or not age:
+        raise ValueError("Team Name and Age Group are required.")
+    practice_minutes = _parse_minutes(practice_txt.strip())
+    game_minutes = _parse_minutes(game_txt.strip())
+
+    if late_enabled:
+        late_time = (late_time or "").strip()
+        if late_time and _HHMM_RE.match(late_time) is None:
+            raise ValueError("Late cutoff time must be in HH:MM format.")
+    else:
+        late_time = None
+
+    preferred, strict_flag = {}, False
+    for day, val, strict in preferred_entries:
+        val = val.strip()
+        if val:
+            if _HHMM_RANGE_RE.match(val) is None:
+                raise ValueError(f"Preferred time for {day} must be in HH:MM-HH:MM format.")
+            preferred[day] = val
+            if strict:
+                preferred[f"{day}_strict"] = True
+                strict_flag = True
+
+    team = {
+        "age": age,
+        "type": ttype.strip(),
+        "practice_duration": practice_minutes,
+        "game_duration": game_minutes,
+        "allow_multiple_per_day": allow_multiple,
+        "allow_shared_ice": allow_shared,
+        "mandatory_shared_ice": mandatory_shared,  # NEW FIELD
+        "late_ice_cutoff_enabled": late_enabled,
+        "late_ice_cutoff_time": late_time,
+        "preferred_days_and_times": preferred,
+        "strict_preferred": strict_flag,
+        "blackout_dates": blackouts,
+    }
+
+    return name, normalize_team_info(team)
+
 
 class TeamTab(ttk.Frame):
     def __init__(self, parent, main_app):
@@ -11,6 +82,13 @@ class TeamTab(ttk.Frame):
         self.main_app = main_app
         self.teams = {}
         self._editing_team = None  # Track which team is being edited
+        self._tree_snapshot = {}  # Last values rendered per row, keyed by team name (the row iid)
+        self._form_change_after_id = None  # Pending debounced _apply_form_change
+        self._blackout_order = {}  # Ordered set (dict keys) mirroring blackout_list
+        self._pref_display_cache = {}  # Team name -> (preferred dict, formatted text)
+        self._status_after_id = None  # Pending clear of the status label
+        self._loaded_snapshot = None  # _snapshot_form() of the team being edited
+        self._save_enabled = False  # Python-side copy of save_btn's state
         self._build_ui()
 
     # -------------------- UI --------------------
@@ -133,12 +211,11 @@ class TeamTab(ttk.Frame):
             entry.bind('<KeyRelease>', self._on_form_change)
 
             strict_var = tk.BooleanVar(value=False)
-            strict_cb = ttk.Checkbutton(pref, variable=strict_var)
+            strict_cb = ttk.Checkbutton(pref, variable=strict_var, command=self._on_form_change)
             strict_cb.grid(row=row, column=2, sticky="w", padx=4)
 
-            self.preferred_day_widgets[day] = {
-                "var": cbvar, "entry": entry, "strict": strict_var
-            }
+            self.preferred_day_widgets[day] = DayWidgets(cbvar, entry, strict_var)
+        self._preferred_days_items = tuple(self.preferred_day_widgets.items())
 
         # Blackouts
         blackout = ttk.LabelFrame(form, text="Blackout Dates", padding=8)
@@ -146,6 +223,8 @@ class TeamTab(ttk.Frame):
         bo_top = ttk.Frame(blackout)
         bo_top.pack(fill="x", pady=(0, 4))
         ttk.Label(bo_top, text="Add blackout date:").pack(side="left")
+        # Imported here so importing this module doesn't pull in tkcalendar
+        from tkcalendar import DateEntry
         self.blackout_date = DateEntry(bo_top, date_pattern="yyyy-mm-dd")
         self.blackout_date.pack(side="left", padx=4)
         ttk.Button(bo_top, text="Add", command=self._add_blackout).pack(side="left")
@@ -166,7 +245,11 @@ class TeamTab(ttk.Frame):
         self.save_btn = ttk.Button(btns, text="Save Changes", command=self._save_changes, state="disabled")
         self.save_btn.pack(side="left", padx=4)
         ttk.Button(btns, text="Delete Team", command=self._delete_team).pack(side="left", padx=4)
-        ttk.Button(btns, text="Clear Form", command=self._clear_form).pack(side="left", padx=4)
+        ttk.Button(btns, text="Clear Form", command=self._reset_form).pack(side="left", padx=4)
+
+        # Status line for non-blocking confirmations
+        self.status_lbl = ttk.Label(form, text="", foreground="green")
+        self.status_lbl.grid(row=12, column=0, columnspan=2, sticky="w", padx=4, pady=(4, 0))
 
         # Right: team list
         list_wrap = ttk.LabelFrame(container, text="Existing Teams", padding=10)
@@ -175,13 +258,12 @@ class TeamTab(ttk.Frame):
         tree_frame = ttk.Frame(list_wrap)
         tree_frame.pack(fill="both", expand=True)
 
-        cols = ("Name", "Age", "Type", "Practice Min", "Game Min", "Shared",
-                "Mandatory Shared", "Strict Pref", "Late Cutoff", "Preferred", "Blackouts")
+        cols = _HEADINGS
+        self._tree_columns = cols
         self.team_tree = ttk.Treeview(tree_frame, columns=cols, show="headings", height=8)
         for c in cols:
             self.team_tree.heading(c, text=c)
-            width = 110 if c in ("Preferred", "Blackouts") else (100 if c == "Mandatory Shared" else 90)
-            self.team_tree.column(c, width=width, anchor="center")
+            self.team_tree.column(c, width=_COL_WIDTHS.get(c, 90), anchor="center")
 
         v_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.team_tree.yview)
         h_scrollbar = ttk.Scrollbar(tree_frame, orient="horizontal", command=self.team_tree.xview)
@@ -196,22 +278,49 @@ class TeamTab(ttk.Frame):
 
         self.team_tree.bind("<<TreeviewSelect>>", self._on_select_team)
 
-        # Bind Ctrl+S
-        self.bind_all("<Control-s>", self._on_ctrl_s)
-        self.bind_all("<Control-S>", self._on_ctrl_s)
+        # Bind Ctrl+S on the main window only (not every widget in the app);
+        # _on_ctrl_s ignores it while another notebook tab is shown
+        toplevel = self.winfo_toplevel()
+        self._ctrl_s_bindings = [
+            (seq, toplevel.bind(seq, self._on_ctrl_s, add="+"))
+            for seq in ("<Control-s>", "<Control-S>")
+        ]
+        self.bind("<Destroy>", self._unbind_ctrl_s, add="+")
+
+        # Defaults restored by _reset_form
+        self._entry_defaults = (
+            (self.name_entry, ""),
+            (self.age_entry, ""),
+            (self.practice_duration_entry, "60"),
+            (self.game_duration_entry, "60"),
+            (self.late_cutoff_entry, "21:00"),
+        )
+        self._var_defaults = (
+            (self.type_var, "house"),
+            (self.allow_multiple_var, False),
+            (self.shared_ice_var, True),
+            (self.mandatory_shared_ice_var, False),
+            (self.late_cutoff_var, False),
+        ) + tuple((v, False) for _, w in self._preferred_days_items for v in (w.var, w.strict))
 
         self._populate_tree()
 
     # -------------------- Helpers --------------------
+    @staticmethod
+    def _set_state(widget, state):
+        """Reconfigure widget's state only if it differs from the current one."""
+        if str(widget.cget("state")) != state:
+            widget.configure(state=state)
+
     def _on_shared_ice_change(self):
         """Handle changes to the shared ice checkbox"""
         if not self.shared_ice_var.get():
             # If shared ice is disabled, also disable mandatory shared ice
             self.mandatory_shared_ice_var.set(False)
-            self.mandatory_shared_ice_cb.config(state="disabled")
+            self._set_state(self.mandatory_shared_ice_cb, "disabled")
         else:
             # If shared ice is enabled, enable the mandatory option
-            self.mandatory_shared_ice_cb.config(state="normal")
+            self._set_state(self.mandatory_shared_ice_cb, "normal")
         self._on_form_change()
 
     def _on_mandatory_shared_change(self):
@@ -223,20 +332,82 @@ class TeamTab(ttk.Frame):
 
     def _toggle_late_cutoff(self):
         state = "normal" if self.late_cutoff_var.get() else "disabled"
-        self.late_cutoff_entry.config(state=state)
+        self._set_state(self.late_cutoff_entry, state)
         self._on_form_change()
 
     def _toggle_pref_entry(self, day):
         widgets = self.preferred_day_widgets[day]
-        widgets["entry"].config(state="normal" if widgets["var"].get() else "disabled")
+        self._set_state(widgets.entry, "normal" if widgets.var.get() else "disabled")
         self._on_form_change()
 
     def _on_form_change(self, event=None):
+        # Coalesce bursts of keystrokes into a single state update
+        self._cancel_form_change()
+        self._form_change_after_id = self.after(150, self._apply_form_change)
+
+    def _apply_form_change(self):
+        self._form_change_after_id = None
         if self._editing_team:
-            self.save_btn.config(state="normal")
+            # Only offer Save when the form differs from the loaded team
+            dirty = self._snapshot_form() != self._loaded_snapshot
+            self._set_save_enabled(dirty)
+
+    def _set_save_enabled(self, enabled):
+        if enabled != self._save_enabled:
+            self._save_enabled = enabled
+            self.save_btn.configure(state="normal" if enabled else "disabled")
+
+    def _snapshot_form(self):
+        """Return a comparable tuple of every value the form holds."""
+        return (
+            self.name_entry.get(),
+            self.age_entry.get(),
+            self.type_var.get(),
+            self.practice_duration_entry.get(),
+            self.game_duration_entry.get(),
+            self.allow_multiple_var.get(),
+            self.shared_ice_var.get(),
+            self.mandatory_shared_ice_var.get(),
+            self.late_cutoff_var.get(),
+            self.late_cutoff_entry.get(),
+            tuple((w.var.get(), w.entry.get(), w.strict.get()) for _, w in self._preferred_days_items),
+            tuple(self._blackout_order),
+        )
+
+    def _cancel_form_change(self):
+        if self._form_change_after_id:
+            self.after_cancel(self._form_change_after_id)
+            self._form_change_after_id = None
+
+    def _show_status(self, text, duration_ms=3000):
+        """Show a short-lived message in the status line without blocking."""
+        if self._status_after_id:
+            self.after_cancel(self._status_after_id)
+        self.status_lbl.config(text=text)
+        self._status_after_id = self.after(duration_ms, self._clear_status)
+
+    def _clear_status(self):
+        self._status_after_id = None
+        self.status_lbl.config(text="")
+
+    def _unbind_ctrl_s(self, event=None):
+        toplevel = self.winfo_toplevel()
+        for seq, funcid in self._ctrl_s_bindings:
+            try:
+                toplevel.unbind(seq, funcid)
+            except tk.TclError:
+                pass  # Toplevel is already being torn down
+        self._ctrl_s_bindings = []
 
     def _on_ctrl_s(self, event=None):
-        if self._editing_team and str(self.save_btn['state']) == 'normal':
+        # Only the selected notebook page is viewable
+        if not self.winfo_viewable():
+            return None
+        # Apply an edit that is still waiting on the debounce
+        if self._form_change_after_id:
+            self._cancel_form_change()
+            self._apply_form_change()
+        if self._editing_team and self._save_enabled:
             self._save_changes()
             if hasattr(self.main_app, 'save_all_data_silently'):
                 self.main_app.save_all_data_silently()
@@ -249,56 +420,61 @@ class TeamTab(ttk.Frame):
 
     def _add_blackout(self):
         # Convert date object to ISO string format
-        date_obj = self.blackout_date.get_date()
-        date_str = date_obj.isoformat() if hasattr(date_obj, 'isoformat') else str(date_obj)
-        existing = set(self.blackout_list.get(0, "end"))
-        if date_str not in existing:
-            self.blackout_list.insert("end", date_str)
-            self._on_form_change()
+        date_str = self.blackout_date.get_date().isoformat()
+        if date_str in self._blackout_order:
+            return
+        self._blackout_order[date_str] = None
+        self.blackout_list.insert("end", date_str)
+        self._on_form_change()
 
     def _remove_blackout(self):
         sel = list(self.blackout_list.curselection())
         for idx in reversed(sel):
+            self._blackout_order.pop(self.blackout_list.get(idx), None)
             self.blackout_list.delete(idx)
         if sel:
             self._on_form_change()
 
-    def _clear_form(self):
-        self._editing_team = None
-        self.save_btn.config(state="disabled")
-        self.add_btn.config(state="normal")
-        self.name_entry.delete(0, "end")
-        self.age_entry.delete(0, "end")
-        self.type_var.set("house")
-        for e in (self.practice_duration_entry, self.game_duration_entry):
-            e.delete(0, "end"); e.insert(0, "60")
-        self.allow_multiple_var.set(False)
-        self.shared_ice_var.set(True)
-        self.mandatory_shared_ice_var.set(False)
-        self.mandatory_shared_ice_cb.config(state="normal")  # Re-enable since shared ice is True
-        self.late_cutoff_var.set(False); self._toggle_late_cutoff()
-        self.late_cutoff_entry.delete(0, "end"); self.late_cutoff_entry.insert(0, "21:00")
-        for day, w in self.preferred_day_widgets.items():
-            w["var"].set(False)
-            w["entry"].config(state="disabled"); w["entry"].delete(0, "end")
-            w["strict"].set(False)
+    def _reset_form(self, reset_editing=True):
+        """Put every form field back to its default.
+
+        With reset_editing, also leave edit mode so the form adds a new team.
+        """
+        if reset_editing:
+            self._cancel_form_change()
+            self._editing_team = None
+            self._loaded_snapshot = None
+            self._set_save_enabled(False)
+            self._set_state(self.add_btn, "normal")
+        for entry, default in self._entry_defaults:
+            entry.delete(0, "end")
+            if default:
+                entry.insert(0, default)
+        for var, default in self._var_defaults:
+            var.set(default)
+        self._set_state(self.mandatory_shared_ice_cb, "normal")  # Re-enable since shared ice is True
+        self._toggle_late_cutoff()
+        for day, w in self._preferred_days_items:
+            w.entry.delete(0, "end")
+            self._set_state(w.entry, "disabled")
         self.blackout_list.delete(0, "end")
+        self._blackout_order.clear()
 
     # -------------------- Data ops --------------------
     def _on_select_team(self, _evt=None):
         sel = self.team_tree.selection()
         if not sel:
             return
-        name = self.team_tree.item(sel[0], "values")[0]
+        name = sel[0]  # Rows use the team name as their iid
         data = self.teams.get(name, {})
         if not data:
             return
 
         self._editing_team = name
-        self.save_btn.config(state="disabled")
-        self.add_btn.config(state="disabled")
+        self._set_save_enabled(False)
+        self._set_state(self.add_btn, "disabled")
 
-        self._clear_form_without_reset()
+        self._reset_form(reset_editing=False)
         self.name_entry.insert(0, name)
         self.age_entry.insert(0, data.get("age", ""))
         self.type_var.set(data.get("type", "house"))
@@ -315,51 +491,32 @@ class TeamTab(ttk.Frame):
         
         # Update mandatory checkbox state based on shared ice setting
         if shared_ice_enabled:
-            self.mandatory_shared_ice_cb.config(state="normal")
+            self._set_state(self.mandatory_shared_ice_cb, "normal")
         else:
-            self.mandatory_shared_ice_cb.config(state="disabled")
+            self._set_state(self.mandatory_shared_ice_cb, "disabled")
 
         if data.get("late_ice_cutoff_enabled"):
             self.late_cutoff_var.set(True); self._toggle_late_cutoff()
             self.late_cutoff_entry.delete(0, "end"); self.late_cutoff_entry.insert(0, data.get("late_ice_cutoff_time", "21:00"))
 
         pref = data.get("preferred_days_and_times", {})
-        for day, w in self.preferred_day_widgets.items():
+        for day, w in self._preferred_days_items:
             val = pref.get(day, "")
             if val:
-                w["var"].set(True); w["entry"].config(state="normal")
-                w["entry"].delete(0, "end"); w["entry"].insert(0, val)
-            w["strict"].set(bool(pref.get(f"{day}_strict", False)))
-
-        # Fix blackout dates handling - ensure they're strings
-        blackout_dates = data.get("blackout_dates", [])
-        for d in blackout_dates:
-            # Convert date objects to strings if needed
-            if hasattr(d, 'isoformat'):
-                date_str = d.isoformat()
-            else:
-                date_str = str(d)
-            self.blackout_list.insert("end", date_str)
+                w.var.set(True); self._set_state(w.entry, "normal")
+                w.entry.delete(0, "end"); w.entry.insert(0, val)
+            w.strict.set(bool(pref.get(f"{day}_strict", False)))
 
-        self._editing_team = name
+        # Blackout dates are already ISO strings (see load_teams_data)
+        for date_str in data.get("blackout_dates", ()):
+            if date_str not in self._blackout_order:
+                self._blackout_order[date_str] = None
+                self.blackout_list.insert("end", date_str)
 
-    def _clear_form_without_reset(self):
-        self.name_entry.delete(0, "end")
-        self.age_entry.delete(0, "end")
-        self.type_var.set("house")
-        for e in (self.practice_duration_entry, self.game_duration_entry):
-            e.delete(0, "end"); e.insert(0, "60")
-        self.allow_multiple_var.set(False)
-        self.shared_ice_var.set(True)
-        self.mandatory_shared_ice_var.set(False)
-        self.mandatory_shared_ice_cb.config(state="normal")
-        self.late_cutoff_var.set(False); self._toggle_late_cutoff()
-        self.late_cutoff_entry.delete(0, "end"); self.late_cutoff_entry.insert(0, "21:00")
-        for day, w in self.preferred_day_widgets.items():
-            w["var"].set(False)
-            w["entry"].config(state="disabled"); w["entry"].delete(0, "end")
-            w["strict"].set(False)
-        self.blackout_list.delete(0, "end")
+        self._editing_team = name
+        # Filling the form is not an edit
+        self._cancel_form_change()
+        self._loaded_snapshot = self._snapshot_form()
 
     def _add_update_team(self):
         team_data = self._collect_team_data()
@@ -371,7 +528,7 @@ class TeamTab(ttk.Frame):
                 return
         self.teams[name] = team
         self._populate_tree()
-        self._clear_form()
+        self._reset_form()
         if hasattr(self.main_app, "on_teams_updated"):
             self.main_app.on_teams_updated(self.teams)
 
@@ -390,110 +547,141 @@ class TeamTab(ttk.Frame):
         self.teams[name] = team
         self._populate_tree()
         self._editing_team = name
-        self.save_btn.config(state="disabled")
-        self.add_btn.config(state="disabled")
+        self._cancel_form_change()
+        self._loaded_snapshot = self._snapshot_form()
+        self._set_save_enabled(False)
+        self._set_state(self.add_btn, "disabled")
         if hasattr(self.main_app, "on_teams_updated"):
             self.main_app.on_teams_updated(self.teams)
-        messagebox.showinfo("Success", f"Team '{name}' updated successfully!")
+        self._show_status(f"Team '{name}' updated successfully!")
 
     def _collect_team_data(self):
-        name = self.name_entry.get().strip()
-        age = self.age_entry.get().strip()
-        ttype = self.type_var.get().strip()
-        if not name or not age:
-            messagebox.showerror("Error", "Team Name and Age Group are required.")
-            return None
+        preferred_entries = [
+            (day, w.entry.get(), w.strict.get())
+            for day, w in self._preferred_days_items if w.var.get()
+        ]
         try:
-            practice_minutes = self._parse_minutes(self.practice_duration_entry.get().strip())
-            game_minutes = self._parse_minutes(self.game_duration_entry.get().strip())
+            return build_team_record(
+                name=self.name_entry.get(),
+                age=self.age_entry.get(),
+                ttype=self.type_var.get(),
+                practice_txt=self.practice_duration_entry.get(),
+                game_txt=self.game_duration_entry.get(),
+                allow_multiple=self.allow_multiple_var.get(),
+                allow_shared=self.shared_ice_var.get(),
+                mandatory_shared=self.mandatory_shared_ice_var.get(),
+                late_enabled=self.late_cutoff_var.get(),
+                late_time=self.late_cutoff_entry.get(),
+                preferred_entries=preferred_entries,
+                blackouts=list(self._blackout_order),
+            )
         except ValueError as e:
             messagebox.showerror("Error", str(e))
             return None
 
-        late_enabled = self.late_cutoff_var.get()
-        late_time = None
-        if late_enabled:
-            late_time = (self.late_cutoff_entry.get() or "").strip()
-            if late_time:
-                if re.match(r"^\d{1,2}:\d{2}$", late_time) is None:
-                    messagebox.showerror("Error", "Late cutoff time must be in HH:MM format.")
-                    return None
-
-        preferred, strict_flag = {}, False
-        for day, w in self.preferred_day_widgets.items():
-            if w["var"].get():
-                val = w["entry"].get().strip()
-                if val:
-                    preferred[day] = val
-                    if w["strict"].get():
-                        preferred[f"{day}_strict"] = True
-                        strict_flag = True
-
-        blackouts = list(self.blackout_list.get(0, "end"))
-
-        team = {
-            "age": age,
-            "type": ttype,
-            "practice_duration": practice_minutes,
-            "game_duration": game_minutes,
-            "allow_multiple_per_day": self.allow_multiple_var.get(),
-            "allow_shared_ice": self.shared_ice_var.get(),
-            "mandatory_shared_ice": self.mandatory_shared_ice_var.get(),  # NEW FIELD
-            "late_ice_cutoff_enabled": late_enabled,
-            "late_ice_cutoff_time": late_time,
-            "preferred_days_and_times": preferred,
-            "strict_preferred": strict_flag,
-            "blackout_dates": blackouts,
-        }
-
-        team = normalize_team_info(team)
-        return name, team
-
-    def _parse_minutes(self, txt):
-        try:
-            return int(txt)
-        except ValueError:
-            raise ValueError("Duration must be an integer number of minutes.")
+    def _preferred_display(self, name, pref):
+        """Return the "Preferred" column text, reusing it while pref is unchanged."""
+        # Keyed by team name rather than stored on the team dict, which is
+        # saved to disk and handed to the scheduler. Saving a team replaces
+        # its preferred dict, so an identity check is enough to invalidate.
+        cached = self._pref_display_cache.get(name)
+        if cached is not None and cached[0] is pref:
+            return cached[1]
+        parts = []
+        for d, t in pref.items():
+            if not d.endswith("_strict"):
+                parts.append(f"{d}: {t}")
+        display = ", ".join(parts)
+        self._pref_display_cache[name] = (pref, display)
+        return display
+
+    def _team_row_values(self, name, team):
+        get = team.get
+        return (
+            name,
+            get("age", ""),
+            get("type", ""),
+            get("practice_duration", ""),
+            get("game_duration", ""),
+            _YES if get("allow_shared_ice") else _NO,
+            _YES if get("mandatory_shared_ice") else _NO,  # NEW COLUMN
+            _YES if get("strict_preferred") else _NO,
+            get("late_ice_cutoff_time") if get("late_ice_cutoff_enabled") else _NO,
+            self._preferred_display(name, get("preferred_days_and_times", {})),
+            ", ".join(get("blackout_dates", [])),
+        )
 
     def _populate_tree(self):
-        for i in self.team_tree.get_children():
-            self.team_tree.delete(i)
-        for name, team in self.teams.items():
-            vals = (
-                name,
-                team.get("age", ""),
-                team.get("type", ""),
-                team.get("practice_duration", ""),
-                team.get("game_duration", ""),
-                "Yes" if team.get("allow_shared_ice") else "No",
-                "Yes" if team.get("mandatory_shared_ice") else "No",  # NEW COLUMN
-                "Yes" if team.get("strict_preferred") else "No",
-                team.get("late_ice_cutoff_time") if team.get("late_ice_cutoff_enabled") else "No",
-                ", ".join(f"{d}: {t}" for d, t in team.get("preferred_days_and_times", {}).items() if not d.endswith("_strict")),
-                ", ".join(team.get("blackout_dates", [])),
-            )
-            self.team_tree.insert("", "end", values=vals)
+        """Sync the tree with self.teams, touching only rows that changed."""
+        old = self._tree_snapshot
+        new = {name: self._team_row_values(name, team) for name, team in self.teams.items()}
+
+        removed = [name for name in old if name not in new]
+        if removed:
+            self.team_tree.delete(*removed)
+            for name in removed:
+                self._pref_display_cache.pop(name, None)
+
+        # For bulk inserts (e.g. loading a file) hide the data columns so Tk
+        # doesn't re-measure the rows after every insert
+        bulk = len(new) - (len(old) - len(removed)) > 1
+        if bulk:
+            display_columns = self.team_tree["displaycolumns"]
+            self.team_tree.configure(displaycolumns=())
+        try:
+            for name, vals in new.items():
+                prev = old.get(name)
+                if prev is None:
+                    self.team_tree.insert("", "end", iid=name, values=vals)
+                elif prev != vals:
+                    changed = [i for i, (a, b) in enumerate(zip(prev, vals)) if a != b]
+                    if len(changed) <= 2:
+                        # Typical edit: patch just the affected cells
+                        for i in changed:
+                            self.team_tree.set(name, self._tree_columns[i], vals[i])
+                    else:
+                        self.team_tree.item(name, values=vals)
+        finally:
+            if bulk:
+                self.team_tree.configure(displaycolumns=display_columns)
+
+        # Surviving rows keep their position and new ones are appended, so
+        # only reorder when that no longer matches the order of self.teams
+        current_order = [n for n in old if n in new] + [n for n in new if n not in old]
+        if current_order != list(new):
+            for index, name in enumerate(new):
+                self.team_tree.move(name, "", index)
+
+        self._tree_snapshot = new
 
     def _delete_team(self):
         sel = self.team_tree.selection()
         if not sel:
             return
-        name = self.team_tree.item(sel[0], "values")[0]
+        name = sel[0]
         if not messagebox.askyesno("Confirm Delete", f"Delete team '{name}'?"):
             return
         del self.teams[name]
         self._populate_tree()
-        self._clear_form()
+        self._reset_form()
         if hasattr(self.main_app, "on_teams_updated"):
             self.main_app.on_teams_updated(self.teams)
 
     def load_teams_data(self, teams_data):
         """Load teams data from external source (like file load)."""
         if teams_data:
-            self.teams = dict(teams_data)  # Create a copy to avoid reference issues
+            # Create a copy to avoid reference issues, converting blackout
+            # dates to ISO strings once here rather than on every selection
+            self.teams = {
+                name: {**team, "blackout_dates": [
+                    d.isoformat() if hasattr(d, "isoformat") else str(d)
+                    for d in team.get("blackout_dates", [])
+                ]}
+                for name, team in teams_data.items()
+            }
             self._populate_tree()
             # Optionally clear the form since we're loading new data
-            self._clear_form()
+            self._reset_form()
 
     def get_teams_data(self):
         """Return current teams data for saving/export."""
@@ -1,44 +1,55 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 import os
+import re
 import json
-import threading
+import multiprocessing
 import webbrowser
 import http.server
 import socketserver
 from urllib.parse import parse_qs, urlparse
-import tempfile
 import socket
 import datetime
+import gzip
+import io
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
 try:
     import qrcode
-    from PIL import Image, ImageTk
+    import qrcode.image.svg
+    from PIL import ImageTk
     QR_AVAILABLE = True
 except ImportError:
     QR_AVAILABLE = False
 
 try:
     import smtplib
-    from email.mime.text import MimeText
-    from email.mime.multipart import MimeMultipart
+    from email.message import EmailMessage
     EMAIL_AVAILABLE = True
 except ImportError:
     EMAIL_AVAILABLE = False
 
-class WebSharingManager:
-    """Manages web-based schedule sharing and notifications."""
-    
-    def __init__(self, main_app):
-        self.main_app = main_app
-        self.web_server = None
-        self.server_port = 8080
-        self.server_thread = None
-        self.shared_schedules = {}
-        
-    def generate_web_schedule(self, schedule_data, teams_data):
-        """Generate HTML for web-based schedule viewing."""
-        html_template = """
+# orjson is optional; it serializes much faster than the stdlib encoder
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import asyncio
+    from aiohttp import web
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# One "@", no whitespace, and a dot somewhere in the domain part
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Page template for the shared schedule; the JSON payload is spliced in at
+# the {schedule_data_json} placeholder.
+_WEB_SCHEDULE_TEMPLATE = """
     <!DOCTYPE html>
     <html lang="en">
     <head>
@@ -257,16 +268,77 @@ class WebSharingManager:
                 </div>
             </div>
         </div>
+        
+        <template id="event-card-template">
+            <div class="event-card">
+                <div class="event-header">
+                    <div class="event-title"></div>
+                    <div class="event-type"></div>
+                </div>
+                <div class="event-details">
+                    <div class="detail-item">
+                        <span class="detail-icon">[DATE]</span>
+                        <span class="event-date"></span>
+                    </div>
+                    <div class="detail-item">
+                        <span class="detail-icon">[TIME]</span>
+                        <span class="event-time"></span>
+                    </div>
+                    <div class="detail-item">
+                        <span class="detail-icon">[ARENA]</span>
+                        <span class="event-arena"></span>
+                    </div>
+                </div>
+            </div>
+        </template>
 
         <script>
-            // Schedule data will be injected here
-            const scheduleData = {schedule_data_json};
+            // Schedule data will be injected here, one array per event field
+            const scheduleColumns = {schedule_data_json};
+            
+            let filteredData = [];
             
-            let filteredData = [...scheduleData];
+            // Per-event fields in date order, built once so filtering and
+            // rendering work by index and never re-derive them
+            const eventCount = scheduleColumns.team.length;
+            const eventTeams = [];
+            const eventOpponents = [];
+            const eventDateStrings = [];
+            const eventTimeSlots = [];
+            const eventArenas = [];
+            const eventTypeLabels = [];
+            const eventTypes = [];
+            const eventDates = new Float64Array(eventCount);
+            const eventSearchText = [];
+            
+            function initIndex() {
+                const cols = scheduleColumns;
+                
+                // Sort once by date and time slot; filtering keeps this order
+                const parsedDates = cols.date.map(date => Date.parse(date));
+                const order = Array.from(parsedDates.keys()).sort((a, b) =>
+                    (parsedDates[a] - parsedDates[b]) ||
+                    cols.time_slot[a].localeCompare(cols.time_slot[b]));
+                
+                for (let i = 0; i < eventCount; i++) {
+                    const j = order[i];
+                    eventTeams.push(cols.team[j]);
+                    eventOpponents.push(cols.opponent[j]);
+                    eventDateStrings.push(cols.date[j]);
+                    eventTimeSlots.push(cols.time_slot[j]);
+                    eventArenas.push(cols.arena[j]);
+                    eventTypeLabels.push(cols.type[j]);
+                    eventTypes.push(cols.type[j].toLowerCase());
+                    eventDates[i] = parsedDates[j];
+                    eventSearchText.push(`${cols.team[j]} ${cols.opponent[j]} ${cols.arena[j]}`.toLowerCase());
+                }
+            }
+            
+            const SEARCH_DEBOUNCE_MS = 120;
             
             function initializeFilters() {
                 const teamFilter = document.getElementById('team-filter');
-                const teams = [...new Set(scheduleData.map(event => event.team))].sort();
+                const teams = [...new Set(eventTeams)].sort();
                 
                 teams.forEach(team => {
                     const option = document.createElement('option');
@@ -279,7 +351,31 @@ class WebSharingManager:
                 document.getElementById('team-filter').addEventListener('change', applyFilters);
                 document.getElementById('type-filter').addEventListener('change', applyFilters);
                 document.getElementById('date-filter').addEventListener('change', applyFilters);
-                document.getElementById('search-filter').addEventListener('input', applyFilters);
+                
+                // Typing re-filters once per pause rather than on every keystroke
+                let searchTimer = null;
+                document.getElementById('search-filter').addEventListener('input', () => {
+                    clearTimeout(searchTimer);
+                    searchTimer = setTimeout(applyFilters, SEARCH_DEBOUNCE_MS);
+                });
+            }
+            
+            // The filter loop is generated to test only the active filters. It is
+            // recompiled when a filter is switched on or off, not per keystroke;
+            // filter values are passed in as arguments, never spliced into code.
+            let compiledFilterKey = null;
+            let compiledFilter = null;
+            
+            function compileFilter(useTeam, useType, useDate, useSearch) {
+                const checks = [];
+                if (useTeam) checks.push('teams[i] === team');
+                if (useType) checks.push('types[i].indexOf(type) >= 0');
+                if (useDate) checks.push('!(dates[i] < lo || dates[i] > hi)');
+                if (useSearch) checks.push('searchText[i].indexOf(search) >= 0');
+                const test = checks.length ? checks.join(' && ') : 'true';
+                return new Function('n', 'teams', 'types', 'dates', 'searchText',
+                                    'team', 'type', 'lo', 'hi', 'search',
+                                    `const keep = []; for (let i = 0; i < n; i++) { if (${test}) keep.push(i); } return keep;`);
             }
             
             function applyFilters() {
@@ -288,143 +384,477 @@ class WebSharingManager:
                 const dateFilter = document.getElementById('date-filter').value;
                 const searchFilter = document.getElementById('search-filter').value.toLowerCase();
                 
-                filteredData = scheduleData.filter(event => {
-                    // Team filter
-                    if (teamFilter && event.team !== teamFilter) return false;
-                    
-                    // Type filter
-                    if (typeFilter) {
-                        const eventType = event.type.toLowerCase();
-                        if (typeFilter === 'shared' && !eventType.includes('shared')) return false;
-                        if (typeFilter !== 'shared' && !eventType.includes(typeFilter)) return false;
-                    }
-                    
-                    // Date filter
-                    if (dateFilter !== 'all') {
-                        const eventDate = new Date(event.date);
-                        const now = new Date();
-                        const weekFromNow = new Date(now.getTime() + 7 * 24 * 60 * 60 * 1000);
-                        const monthFromNow = new Date(now.getFullYear(), now.getMonth() + 1, now.getDate());
-                        
-                        switch(dateFilter) {
-                            case 'week':
-                                if (eventDate < now || eventDate > weekFromNow) return false;
-                                break;
-                            case 'month':
-                                if (eventDate < now || eventDate > monthFromNow) return false;
-                                break;
-                            case 'upcoming':
-                                if (eventDate < now) return false;
-                                break;
-                        }
-                    }
-                    
-                    // Search filter
-                    if (searchFilter) {
-                        const searchText = `${event.team} ${event.opponent} ${event.arena}`.toLowerCase();
-                        if (!searchText.includes(searchFilter)) return false;
+                // Date filter bounds; 'all' leaves the range unbounded
+                let lo = -Infinity;
+                let hi = Infinity;
+                if (dateFilter !== 'all') {
+                    const now = new Date();
+                    lo = now.getTime();
+                    if (dateFilter === 'week') {
+                        hi = lo + 7 * 24 * 60 * 60 * 1000;
+                    } else if (dateFilter === 'month') {
+                        hi = new Date(now.getFullYear(), now.getMonth() + 1, now.getDate()).getTime();
                     }
-                    
-                    return true;
-                });
+                }
+                
+                const useTeam = !!teamFilter;
+                const useType = !!typeFilter;
+                const useDate = dateFilter !== 'all';
+                const useSearch = !!searchFilter;
+                const key = `${useTeam}|${useType}|${useDate}|${useSearch}`;
+                if (key !== compiledFilterKey) {
+                    compiledFilter = compileFilter(useTeam, useType, useDate, useSearch);
+                    compiledFilterKey = key;
+                }
+                
+                // filteredData holds event indexes
+                filteredData = compiledFilter(eventCount, eventTeams, eventTypes, eventDates, eventSearchText,
+                                              teamFilter, typeFilter, lo, hi, searchFilter);
                 
                 renderSchedule();
                 updateStats();
             }
             
+            // Cards are appended in chunks, one per animation frame, so large
+            // schedules never block the page; a newer render cancels an older one.
+            const RENDER_CHUNK_SIZE = 200;
+            let renderToken = 0;
+            let cardTemplate = null;
+            
             function renderSchedule() {
                 const container = document.getElementById('schedule-container');
                 const noResults = document.getElementById('no-results');
+                const token = ++renderToken;
+                
+                container.replaceChildren(noResults);
                 
                 if (filteredData.length === 0) {
-                    container.innerHTML = '';
-                    container.appendChild(noResults);
                     noResults.style.display = 'block';
                     return;
                 }
                 
                 noResults.style.display = 'none';
                 
-                // Sort by date and time
-                filteredData.sort((a, b) => {
-                    if (a.date !== b.date) return new Date(a.date) - new Date(b.date);
-                    return a.time_slot.localeCompare(b.time_slot);
-                });
+                const events = filteredData;
+                let next = 0;
+                
+                function renderChunk() {
+                    if (token !== renderToken) return;
+                    
+                    const fragment = document.createDocumentFragment();
+                    const end = Math.min(next + RENDER_CHUNK_SIZE, events.length);
+                    for (; next < end; next++) {
+                        fragment.appendChild(createEventCard(events[next]));
+                    }
+                    container.appendChild(fragment);
+                    
+                    if (next < events.length) requestAnimationFrame(renderChunk);
+                }
                 
-                container.innerHTML = filteredData.map(event => createEventCard(event)).join('');
+                renderChunk();
+            }
+            
+            // One formatter for the page, and one label per distinct date
+            const DATE_FMT = new Intl.DateTimeFormat('en-US', {
+                weekday: 'long',
+                year: 'numeric',
+                month: 'long',
+                day: 'numeric'
+            });
+            const dateLabels = new Map();
+            
+            function formatEventDate(date) {
+                let label = dateLabels.get(date);
+                if (label === undefined) {
+                    const eventDate = new Date(date);
+                    label = isNaN(eventDate) ? 'Invalid Date' : DATE_FMT.format(eventDate);
+                    dateLabels.set(date, label);
+                }
+                return label;
             }
             
-            function createEventCard(event) {
-                const eventType = event.type.toLowerCase();
+            function createEventCard(i) {
+                const eventType = eventTypes[i];
                 let typeClass = 'type-practice';
                 if (eventType.includes('game')) typeClass = 'type-game';
                 else if (eventType.includes('shared')) typeClass = 'type-shared';
                 
-                const eventDate = new Date(event.date);
-                const formattedDate = eventDate.toLocaleDateString('en-US', {
-                    weekday: 'long',
-                    year: 'numeric',
-                    month: 'long',
-                    day: 'numeric'
-                });
+                const formattedDate = formatEventDate(eventDateStrings[i]);
                 
-                const opponent = event.opponent === 'Practice' ? '' : ` vs ${event.opponent}`;
+                const opponent = eventOpponents[i] === 'Practice' ? '' : ` vs ${eventOpponents[i]}`;
                 
-                return `
-                    <div class="event-card">
-                        <div class="event-header">
-                            <div class="event-title">${event.team}${opponent}</div>
-                            <div class="event-type ${typeClass}">${event.type}</div>
-                        </div>
-                        <div class="event-details">
-                            <div class="detail-item">
-                                <span class="detail-icon">[DATE]</span>
-                                <span>${formattedDate}</span>
-                            </div>
-                            <div class="detail-item">
-                                <span class="detail-icon">[TIME]</span>
-                                <span>${event.time_slot}</span>
-                            </div>
-                            <div class="detail-item">
-                                <span class="detail-icon">[ARENA]</span>
-                                <span>${event.arena}</span>
-                            </div>
-                        </div>
-                    </div>
-                `;
+                const card = cardTemplate.cloneNode(true);
+                card.querySelector('.event-title').textContent = `${eventTeams[i]}${opponent}`;
+                const typeLabel = card.querySelector('.event-type');
+                typeLabel.textContent = eventTypeLabels[i];
+                typeLabel.classList.add(typeClass);
+                card.querySelector('.event-date').textContent = formattedDate;
+                card.querySelector('.event-time').textContent = eventTimeSlots[i];
+                card.querySelector('.event-arena').textContent = eventArenas[i];
+                return card;
             }
             
             function updateStats() {
-                document.getElementById('total-events').textContent = scheduleData.length;
-                document.getElementById('total-teams').textContent = 
-                    new Set(scheduleData.map(event => event.team)).size;
+                document.getElementById('total-events').textContent = eventCount;
+                document.getElementById('total-teams').textContent = new Set(eventTeams).size;
                 
-                const now = new Date();
-                const weekFromNow = new Date(now.getTime() + 7 * 24 * 60 * 60 * 1000);
-                const thisWeekEvents = scheduleData.filter(event => {
-                    const eventDate = new Date(event.date);
-                    return eventDate >= now && eventDate <= weekFromNow;
-                });
-                document.getElementById('upcoming-events').textContent = thisWeekEvents.length;
+                const now = Date.now();
+                const weekFromNow = now + 7 * 24 * 60 * 60 * 1000;
+                let thisWeekEvents = 0;
+                for (let i = 0; i < eventCount; i++) {
+                    if (eventDates[i] >= now && eventDates[i] <= weekFromNow) thisWeekEvents++;
+                }
+                document.getElementById('upcoming-events').textContent = thisWeekEvents;
             }
             
             // Initialize on page load
             document.addEventListener('DOMContentLoaded', function() {
+                cardTemplate = document.getElementById('event-card-template').content.firstElementChild;
+                initIndex();
                 initializeFilters();
-                renderSchedule();
-                updateStats();
+                applyFilters();
             });
         </script>
     </body>
     </html>"""
+
+def _minify_template(text):
+    """Drop indentation, blank lines and whole-line // comments from the template."""
+    lines = (line.strip() for line in text.splitlines())
+    return "\n".join(line for line in lines if line and not line.startswith("//"))
+
+# Event fields sent to the page, one JSON array per field
+_WEB_SCHEDULE_COLUMNS = ("team", "opponent", "date", "time_slot", "arena", "type")
+
+_WEB_SCHEDULE_PREFIX, _WEB_SCHEDULE_SUFFIX = _minify_template(
+    _WEB_SCHEDULE_TEMPLATE).encode('utf-8').split(b"{schedule_data_json}", 1)
+
+class _ScheduleRequestHandler(http.server.SimpleHTTPRequestHandler):
+    """Serves the pre-rendered schedule page held on the server instance."""
+    
+    # Every response carries a Content-Length, so browsers can keep the
+    # connection open; each connection has its own server thread
+    protocol_version = "HTTP/1.1"
+    
+    def do_GET(self):
+        if self.path == '/' or self.path == '/index.html':
+            # Page is pre-encoded and pre-compressed on the server,
+            # so the body goes out without any per-request copy
+            body = self.server.cached_html
+            self.send_response(200)
+            self.send_header('Content-type', 'text/html; charset=utf-8')
+            if 'gzip' in self.headers.get('Accept-Encoding', ''):
+                body = self.server.cached_gzip
+                self.send_header('Content-Encoding', 'gzip')
+            self.send_header('Vary', 'Accept-Encoding')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(memoryview(body))
+        else:
+            super().do_GET()
+            
+    def log_message(self, format, *args):
+        # Suppress server logs
+        pass
+
+
+class _ScheduleHTTPServer(http.server.ThreadingHTTPServer):
+    """Threaded HTTP server tuned for small request/response exchanges.
+    
+    One thread per connection, so a phone stalling mid-response does not
+    hold up every other viewer.
+    """
+    
+    daemon_threads = True
+    
+    # SO_REUSEADDR lets a restart rebind while old connections sit in
+    # TIME_WAIT; on Windows it would let two servers share the port instead
+    allow_reuse_address = os.name != "nt"
+    
+    def get_request(self):
+        conn, addr = super().get_request()
+        # Send responses immediately instead of waiting on Nagle's algorithm,
+        # and let the OS reap connections from phones that went away
+        conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        conn.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 60)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPINTVL, 10)
+            conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT, 3)
+        return conn, addr
+        
+    def server_bind(self):
+        # HTTPServer.server_bind resolves the host's FQDN, which can stall
+        # for seconds on networks without reverse DNS; the name is unused
+        socketserver.TCPServer.server_bind(self)
+        self.server_name, self.server_port = self.server_address[:2]
+
+
+def _serve_schedule(port, page, page_gz, ready):
+    """Server process entry point: serve the schedule page until terminated.
+
+    Sends None through the ready pipe once the port is bound, or the error
+    message if binding failed.
+    """
+    if AIOHTTP_AVAILABLE:
+        async def index(request):
+            if 'gzip' in request.headers.get('Accept-Encoding', ''):
+                return web.Response(body=page_gz, content_type="text/html", charset="utf-8",
+                                    headers={'Content-Encoding': 'gzip', 'Vary': 'Accept-Encoding'})
+            return web.Response(body=page, content_type="text/html", charset="utf-8")
+
+        app = web.Application()
+        app.router.add_get("/", index)
+        app.router.add_get("/index.html", index)
+
+        loop = asyncio.new_event_loop()
+        runner = web.AppRunner(app, access_log=None)
+        try:
+            loop.run_until_complete(runner.setup())
+            loop.run_until_complete(web.TCPSite(runner, port=port).start())
+        except Exception as e:
+            ready.send(str(e))
+            return
+        ready.send(None)
+        loop.run_forever()
+    else:
+        try:
+            httpd = _ScheduleHTTPServer(("", port), _ScheduleRequestHandler)
+        except OSError as e:
+            ready.send(str(e))
+            return
+        httpd.cached_html = page
+        httpd.cached_gzip = page_gz
+        ready.send(None)
+        with httpd:
+            httpd.serve_forever()
+
+
+class WebSharingManager:
+    """Manages web-based schedule sharing and notifications."""
+    
+    # Rendered pages shared by every manager, so reopening the sharing
+    # dialog does not re-render an unchanged schedule. Maps a schedule
+    # fingerprint to [html bytes, gzip bytes or None, schedule list], least
+    # recent first; holding the list keeps its id() from being reused.
+    _page_cache = OrderedDict()
+    _PAGE_CACHE_SIZE = 4
+    
+    # LAN address, looked up once per application run
+    _local_ip = None
+    
+    def __init__(self, main_app):
+        self.main_app = main_app
+        self.server_process = None
+        self.server_port = 8080
+        self.shared_schedules = {}
+        self._ical_cache = {}  # (calendar name, event ids) -> (iCal bytes, events)
+        self._ical_version = None  # schedule_version the cached calendars belong to
+        self._team_groups = None  # (schedule key, schedule list, {team: (events)})
+        
+    @staticmethod
+    def _schedule_json(schedule_data):
+        """Serialize the schedule column-wise to compact UTF-8 encoded JSON."""
+        # One array per field instead of one object per event: field names
+        # are not repeated and the page script indexes the arrays directly
+        columns = {key: [event.get(key, "") for event in schedule_data]
+                   for key in _WEB_SCHEDULE_COLUMNS}
+        if ORJSON_AVAILABLE:
+            return orjson.dumps(columns, default=str)
+        # Compact separators keep the payload small; default=str covers the
+        # date objects that can show up in schedule entries.
+        return json.dumps(columns, separators=(",", ":"), default=str).encode('utf-8')
+
+    def generate_web_schedule(self, schedule_data, teams_data):
+        """Generate UTF-8 encoded HTML for web-based schedule viewing."""
+        return b"".join((_WEB_SCHEDULE_PREFIX, self._schedule_json(schedule_data),
+                         _WEB_SCHEDULE_SUFFIX))
+
+    def _schedule_key(self, schedule_data):
+        """Fingerprint of a schedule list that changes whenever the schedule does."""
+        return (id(schedule_data), len(schedule_data),
+                getattr(self.main_app, 'schedule_version', None))
+
+    def events_by_team(self, schedule_data):
+        """Return {team: (events)} for the schedule, grouped in one pass and cached.
+
+        The per-team tuples are shared by every caller until the schedule
+        changes, so they must not be modified.
+        """
+        key = self._schedule_key(schedule_data)
+        if self._team_groups is None or self._team_groups[0] != key:
+            by_team = defaultdict(list)
+            for event in schedule_data:
+                team = event.get("team")
+                if team:
+                    by_team[team].append(event)
+            # Holding the list keeps its id() from being reused while cached
+            self._team_groups = (key, schedule_data,
+                                 {team: tuple(events) for team, events in by_team.items()})
+        return self._team_groups[2]
+
+    def get_schedule_page(self, schedule_data, teams_data, compressed=False):
+        """Return the schedule page as UTF-8 bytes, reusing recent renders.
+
+        With compressed=True the gzip-encoded page is returned instead; it is
+        compressed at most once per render.
+        """
+        key = self._schedule_key(schedule_data)
+        cache = WebSharingManager._page_cache
+        entry = cache.get(key)
+        if entry is None:
+            entry = cache[key] = [self.generate_web_schedule(schedule_data, teams_data), None,
+                                 schedule_data]
+            if len(cache) > self._PAGE_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        if not compressed:
+            return entry[0]
+        if entry[1] is None:
+            entry[1] = gzip.compress(entry[0], 6)
+        return entry[1]
+
+    def generate_ical(self, events, calendar_name):
+        """Generate UTF-8 encoded iCal data from events."""
+        return "".join(self.iter_ical(events, calendar_name)).encode('utf-8')
+
+    def iter_ical(self, events, calendar_name):
+        """Yield iCal text for events one component at a time."""
+        yield (
+            "BEGIN:VCALENDAR\r\n"
+            "VERSION:2.0\r\n"
+            "PRODID:-//Hockey Scheduler//Team Schedule//EN\r\n"
+            f"X-WR-CALNAME:{calendar_name} Hockey Schedule\r\n"
+            f"X-WR-CALDESC:Hockey schedule for {calendar_name}\r\n"
+        )
         
-        # Convert schedule data to JSON
-        schedule_json = json.dumps(schedule_data)
-        
-        # Replace placeholder with actual data
-        html_content = html_template.replace('{schedule_data_json}', schedule_json)
+        for event in events:
+            date_str = event.get("date", "")
+            time_slot = event.get("time_slot", "")
+            arena = event.get("arena", "")
+            opponent = event.get("opponent", "Practice")
+            event_type = event.get("type", "practice")
+            team = event.get("team", "")
+            
+            if date_str and time_slot and "-" in time_slot:
+                try:
+                    # Parse date and time; splitting the fixed YYYY-MM-DD and
+                    # HH:MM formats is much cheaper than strptime
+                    if isinstance(date_str, str):
+                        year, month, day = date_str.split("-")
+                        event_date = datetime.date(int(year), int(month), int(day))
+                    else:
+                        event_date = date_str
+                        
+                    start_time_str, end_time_str = time_slot.split("-")
+                    start_hour, start_minute = start_time_str.split(":")
+                    end_hour, end_minute = end_time_str.split(":")
+                    start_time = datetime.time(int(start_hour), int(start_minute))
+                    end_time = datetime.time(int(end_hour), int(end_minute))
+                    
+                    # Format for iCal
+                    day_ical = f"{event_date.year:04d}{event_date.month:02d}{event_date.day:02d}"
+                    start_ical = f"{day_ical}T{start_time.hour:02d}{start_time.minute:02d}00"
+                    end_ical = f"{day_ical}T{end_time.hour:02d}{end_time.minute:02d}00"
+                    
+                    # Create unique ID
+                    uid = f"{team}-{date_str}-{start_time_str}@hockeyscheduler.local"
+                    
+                    # Determine event title
+                    if opponent == "Practice":
+                        title = f"{team} Practice"
+                    else:
+                        title = f"{team} vs {opponent}"
+                    
+                    yield (
+                        "BEGIN:VEVENT\r\n"
+                        f"UID:{uid}\r\n"
+                        f"DTSTART:{start_ical}\r\n"
+                        f"DTEND:{end_ical}\r\n"
+                        f"SUMMARY:{title}\r\n"
+                        f"LOCATION:{arena}\r\n"
+                        f"DESCRIPTION:Type: {event_type}\r\n"
+                        "END:VEVENT\r\n"
+                    )
+                    
+                except ValueError:
+                    continue  # Skip invalid events
         
-        return html_content
+        yield "END:VCALENDAR\r\n"
+
+    def get_ical(self, events, calendar_name):
+        """Return iCal data for events, reusing it while the schedule is unchanged."""
+        ical_data = self.cached_ical(events, calendar_name)
+        if ical_data is None:
+            ical_data = self.generate_ical(events, calendar_name)
+            # Holding the events keeps their ids from being reused while cached
+            self._ical_cache[(calendar_name, tuple(map(id, events)))] = (ical_data, events)
+        return ical_data
+
+    def cached_ical(self, events, calendar_name):
+        """Return iCal data already built by get_ical for this schedule, or None."""
+        version = getattr(self.main_app, 'schedule_version', None)
+        if version != self._ical_version:
+            self._ical_cache.clear()
+            self._ical_version = version
+        entry = self._ical_cache.get((calendar_name, tuple(map(id, events))))
+        return entry[0] if entry is not None else None
+
+    @classmethod
+    def get_local_ip(cls):
+        """Return this machine's LAN address, found without a DNS lookup."""
+        if cls._local_ip is None:
+            cls._local_ip = cls._discover_local_ip()
+        return cls._local_ip
+
+    @staticmethod
+    def _discover_local_ip():
+        # Connecting a UDP socket only selects a route; no packets are sent
+        try:
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                return s.getsockname()[0]
+        except OSError:
+            pass
+        try:
+            return socket.gethostbyname(socket.gethostname())
+        except OSError:
+            return "127.0.0.1"
+
+    def start_server_process(self, page, page_gz, port):
+        """Serve the schedule page from a separate process.
+
+        Request handling then never competes with the Tk main loop for the
+        GIL. Blocks until the child has bound the port so errors such as a
+        port already in use reach the caller.
+
+        The child is always spawned, never forked: callers may be on a worker
+        thread, and forking a threaded Tk process is unsafe.
+        """
+        ctx = multiprocessing.get_context("spawn")
+        ready, child_ready = ctx.Pipe(duplex=False)
+        process = ctx.Process(target=_serve_schedule,
+                              args=(port, page, page_gz, child_ready), daemon=True)
+        process.start()
+        child_ready.close()
+        try:
+            error = ready.recv() if ready.poll(10) else "Web server did not start in time"
+        except EOFError:
+            error = "Web server process exited during startup"
+        finally:
+            ready.close()
+        if error is not None:
+            process.terminate()
+            process.join()
+            raise OSError(error)
+        self.server_process = process
+
+    def stop_server_process(self):
+        """Terminate the process started by start_server_process."""
+        process, self.server_process = self.server_process, None
+        process.terminate()
+        process.join(timeout=5)
 
 
 class WebSharingDialog(tk.Toplevel):
@@ -443,7 +873,14 @@ class WebSharingDialog(tk.Toplevel):
         
         # Initialize variables
         self.team_share_vars = {}
-        self.temp_html = None
+        self._qr_cache = {}  # url -> (PhotoImage, SVG bytes, PNG bytes)
+        self._smtp = None  # logged-in SMTP connection reused across sends
+        self._smtp_settings = None
+        
+        # Slow work (page rendering, server start-up, QR images, file
+        # exports) runs here so the dialog keeps responding
+        self._io_pool = ThreadPoolExecutor(max_workers=4)
+        self._background_polls = {}  # future -> pending after() id
         
         self.setup_ui()
         
@@ -574,39 +1011,15 @@ class WebSharingDialog(tk.Toplevel):
         password_entry.grid(row=3, column=1, sticky="ew", padx=5, pady=2)
         
         # Create the test button first
-        test_button = ttk.Button(smtp_frame, text="Test Connection", 
-                                command=self.test_email_connection, state="disabled")
-        test_button.grid(row=4, column=0, columnspan=2, pady=10)
-        
-        # FIXED: Corrected validation function with proper button reference
-        def validate_email_fields(*args):
-            email = self.email_var.get().strip()
-            password = self.password_var.get().strip()
-            server = self.smtp_server_var.get().strip()
-            port = self.smtp_port_var.get().strip()
-            
-            # Debug print to see what's happening
-            print(f"Validation check - Email: '{email}', Password: {'*' * len(password)}, Server: '{server}', Port: '{port}', EMAIL_AVAILABLE: {email_available}")
-            
-            # Enable test button only if all fields are filled and email is available
-            if email and password and server and port and email_available:
-                test_button.config(state="normal")
-                print("Test button enabled")
-            else:
-                test_button.config(state="disabled")
-                print("Test button disabled")
-        
-        # Bind validation to entry widgets directly
-        smtp_server_entry.bind('<KeyRelease>', validate_email_fields)
-        smtp_port_entry.bind('<KeyRelease>', validate_email_fields)
-        email_entry.bind('<KeyRelease>', validate_email_fields)
-        password_entry.bind('<KeyRelease>', validate_email_fields)
+        self.test_button = ttk.Button(smtp_frame, text="Test Connection", 
+                                     command=self.test_email_connection, state="disabled")
+        self.test_button.grid(row=4, column=0, columnspan=2, pady=10)
         
-        # Also bind to StringVar traces as backup
-        self.email_var.trace_add("write", validate_email_fields)
-        self.password_var.trace_add("write", validate_email_fields)
-        self.smtp_server_var.trace_add("write", validate_email_fields)
-        self.smtp_port_var.trace_add("write", validate_email_fields)
+        # Variable traces cover typing and pasting alike; a burst of writes is
+        # coalesced into one validation pass when Tk goes idle
+        self._email_validation_pending = False
+        for var in (self.email_var, self.password_var, self.smtp_server_var, self.smtp_port_var):
+            var.trace_add("write", self._schedule_email_validation)
         
         # Gmail and Outlook help
         help_frame = ttk.LabelFrame(parent, text="Email Configuration Help", padding=10)
@@ -675,6 +1088,20 @@ Other providers:
         ttk.Button(recipients_frame, text="Remove Selected", 
                   command=self.remove_email_recipient).pack(pady=5)
 
+    def _schedule_email_validation(self, *args):
+        """Queue a single validation of the email fields for the next idle moment."""
+        if self._email_validation_pending:
+            return
+        self._email_validation_pending = True
+        self.after_idle(self._validate_email_fields)
+        
+    def _validate_email_fields(self):
+        """Enable the test button only when every email field is filled in."""
+        self._email_validation_pending = False
+        fields = (self.email_var, self.password_var, self.smtp_server_var, self.smtp_port_var)
+        ready = EMAIL_AVAILABLE and all(var.get().strip() for var in fields)
+        self.test_button.config(state="normal" if ready else "disabled")
+
     def setup_export_tab(self, parent):
         """Setup calendar export options."""
         # iCal export
@@ -770,6 +1197,15 @@ Other providers:
             self.export_team_combo.configure(values=team_names)
             if team_names and not self.export_team_var.get():
                 self.export_team_var.set(team_names[0])
+                
+        # Build the per-team event index now, so calendar exports reuse it
+        self.web_manager.events_by_team(self._get_schedule_data())
+        
+    def _get_schedule_data(self):
+        """Return the current schedule, preferring the main UI's live copy."""
+        if hasattr(self.main_app, 'main_ui') and hasattr(self.main_app.main_ui, 'get_schedule_data'):
+            return self.main_app.main_ui.get_schedule_data() or []
+        return getattr(self.main_app, 'schedule_data', [])
     
     def start_web_server(self):
         """Start the web server for schedule sharing."""
@@ -777,75 +1213,65 @@ Other providers:
             port = int(self.port_var.get())
             
             # Generate HTML content
-            schedule_data = getattr(self.main_app, 'schedule_data', [])
-            if hasattr(self.main_app, 'main_ui') and hasattr(self.main_app.main_ui, 'get_schedule_data'):
-                schedule_data = self.main_app.main_ui.get_schedule_data()
-                
+            schedule_data = self._get_schedule_data()
             teams_data = getattr(self.main_app, 'teams_data', {})
+        except Exception as e:
+            messagebox.showerror("Server Error", f"Failed to start web server: {e}")
+            return
+            
+        if not schedule_data:
+            messagebox.showwarning("No Data", "No schedule data available to share.")
+            return
             
-            if not schedule_data:
-                messagebox.showwarning("No Data", "No schedule data available to share.")
+        def work():
+            page = self.web_manager.get_schedule_page(schedule_data, teams_data)
+            page_gz = self.web_manager.get_schedule_page(schedule_data, teams_data, compressed=True)
+            
+            # Start HTTP server; the page is served straight from memory
+            self.web_manager.start_server_process(page, page_gz, port)
+            return f"http://{self.web_manager.get_local_ip()}:{port}"
+            
+        def done(future):
+            try:
+                url = future.result()
+            except Exception as e:
+                self.server_status_var.set("Stopped")
+                self.start_button.config(state="normal")
+                messagebox.showerror("Server Error", f"Failed to start web server: {e}")
                 return
                 
-            html_content = self.web_manager.generate_web_schedule(schedule_data, teams_data)
-            
-            # Create temporary HTML file with UTF-8 encoding
-            self.temp_html = tempfile.NamedTemporaryFile(mode='w', suffix='.html', delete=False, encoding='utf-8')
-            self.temp_html.write(html_content)
-            self.temp_html.close()
-            
-            # Start HTTP server
-            def start_server():
-                class CustomHandler(http.server.SimpleHTTPRequestHandler):
-                    def __init__(self, *args, **kwargs):
-                        super().__init__(*args, **kwargs)
-                        
-                    def do_GET(self):
-                        if self.path == '/' or self.path == '/index.html':
-                            self.send_response(200)
-                            self.send_header('Content-type', 'text/html; charset=utf-8')
-                            self.end_headers()
-                            # Read and send file with UTF-8 encoding
-                            with open(self.temp_html.name, 'r', encoding='utf-8') as f:
-                                content = f.read()
-                                self.wfile.write(content.encode('utf-8'))
-                        else:
-                            super().do_GET()
-                            
-                    def log_message(self, format, *args):
-                        # Suppress server logs
-                        pass
-                            
-                with socketserver.TCPServer(("", port), CustomHandler) as httpd:
-                    self.web_manager.web_server = httpd
-                    httpd.serve_forever()
-                    
-            self.web_manager.server_thread = threading.Thread(target=start_server, daemon=True)
-            self.web_manager.server_thread.start()
-            
             # Update UI
             self.server_status_var.set("Running")
             self.status_label.config(foreground="green")
-            
-            # Get local IP
-            hostname = socket.gethostname()
-            local_ip = socket.gethostbyname(hostname)
-            url = f"http://{local_ip}:{port}"
             self.server_url_var.set(url)
+            self._qr_cache.clear()
             
-            self.start_button.config(state="disabled")
             self.stop_button.config(state="normal")
             
             messagebox.showinfo("Server Started", f"Web server started successfully!\n\nLocal access: http://localhost:{port}\nNetwork access: {url}")
             
-        except Exception as e:
-            messagebox.showerror("Server Error", f"Failed to start web server: {e}")
+        self.start_button.config(state="disabled")
+        self.server_status_var.set("Starting...")
+        self._run_in_background(work, done)
+
+    def _run_in_background(self, work, on_done):
+        """Run work() on the I/O pool and pass its future to on_done on the Tk thread."""
+        future = self._io_pool.submit(work)
+        
+        # Tk is only touched from this thread, so poll instead of calling back
+        def poll():
+            if future.done():
+                del self._background_polls[future]
+                on_done(future)
+            else:
+                self._background_polls[future] = self.after(50, poll)
+                
+        self._background_polls[future] = self.after(50, poll)
 
     def stop_web_server(self):
         """Stop the web server."""
-        if self.web_manager.web_server:
-            self.web_manager.web_server.shutdown()
-            self.web_manager.web_server = None
+        if self.web_manager.server_process:
+            self.web_manager.stop_server_process()
             
         self.server_status_var.set("Stopped")
         self.status_label.config(foreground="red")
@@ -854,13 +1280,6 @@ Other providers:
         self.start_button.config(state="normal")
         self.stop_button.config(state="disabled")
         
-        # Clean up temp file
-        if hasattr(self, 'temp_html'):
-            try:
-                os.unlink(self.temp_html.name)
-            except:
-                pass
-                
     def open_web_schedule(self, event=None):
         """Open the web schedule in default browser."""
         url = self.server_url_var.get()
@@ -878,36 +1297,64 @@ Other providers:
             messagebox.showwarning("Server Not Running", "Please start the web server first.")
             return
             
-        try:
-            # Generate QR code
-            qr = qrcode.QRCode(version=1, box_size=10, border=5)
+        cached = self._qr_cache.get(url)
+        if cached is not None:
+            self._show_qr_code(*cached)
+            return
+            
+        def work():
+            # Generate QR code; a URL needs only the lowest error
+            # correction level, which keeps the matrix small
+            qr = qrcode.QRCode(version=None, error_correction=qrcode.constants.ERROR_CORRECT_L,
+                               box_size=8, border=2)
             qr.add_data(url)
             qr.make(fit=True)
             
-            # Create QR code image
-            qr_img = qr.make_image(fill_color="black", back_color="white")
+            # Raster at the native box size (about 200px for a LAN URL) for
+            # the preview; resampling a two-colour image only blurs it
+            qr_img = qr.make_image(fill_color="black", back_color="white").convert("L")
+            png = io.BytesIO()
+            qr_img.save(png, format="PNG")
             
-            # Convert for tkinter
-            qr_img = qr_img.resize((200, 200), Image.Resampling.LANCZOS)
-            self.qr_photo = ImageTk.PhotoImage(qr_img)
+            # Vector copy for saving, sharp at any print size
+            svg = io.BytesIO()
+            qr.make_image(image_factory=qrcode.image.svg.SvgImage).save(svg)
+            return qr_img, svg.getvalue(), png.getvalue()
             
-            # Display in dialog
-            if hasattr(self, 'qr_label'):
-                self.qr_label.configure(image=self.qr_photo, text="")
+        def done(future):
+            try:
+                qr_img, qr_svg, qr_png = future.result()
+            except Exception as e:
+                messagebox.showerror("QR Code Error", f"Failed to generate QR code: {e}")
+                return
+            # PhotoImage must be created on the Tk thread
+            cached = self._qr_cache[url] = (ImageTk.PhotoImage(qr_img), qr_svg, qr_png)
+            self._show_qr_code(*cached)
             
-            # Save QR code
-            filename = filedialog.asksaveasfilename(
-                defaultextension=".png",
-                filetypes=[("PNG files", "*.png")],
-                initialfile="schedule_qr_code.png"
-            )
+        self._run_in_background(work, done)
+        
+    def _show_qr_code(self, photo, qr_svg, qr_png):
+        """Display a generated QR code and offer to save it."""
+        self.qr_photo = photo
+        
+        # Display in dialog
+        if hasattr(self, 'qr_label'):
+            self.qr_label.configure(image=self.qr_photo, text="")
             
-            if filename:
-                qr_img.save(filename)
+        # Save QR code
+        filename = filedialog.asksaveasfilename(
+            defaultextension=".svg",
+            filetypes=[("SVG files", "*.svg"), ("PNG files", "*.png")],
+            initialfile="schedule_qr_code.svg"
+        )
+        
+        if filename:
+            try:
+                with open(filename, 'wb') as f:
+                    f.write(qr_png if filename.lower().endswith(".png") else qr_svg)
                 messagebox.showinfo("QR Code Saved", f"QR code saved to {filename}")
-                
-        except Exception as e:
-            messagebox.showerror("QR Code Error", f"Failed to generate QR code: {e}")
+            except OSError as e:
+                messagebox.showerror("QR Code Error", f"Failed to save QR code: {e}")
             
     def test_email_connection(self):
         """Test the email server connection."""
@@ -916,8 +1363,6 @@ Other providers:
             return
             
         try:
-            import smtplib
-            
             server_name = self.smtp_server_var.get().strip()
             port = int(self.smtp_port_var.get().strip())
             email = self.email_var.get().strip()
@@ -927,11 +1372,9 @@ Other providers:
                 messagebox.showerror("Missing Information", "Please fill in all email configuration fields.")
                 return
             
-            # Test connection
-            server = smtplib.SMTP(server_name, port)
-            server.starttls()
-            server.login(email, password)
-            server.quit()
+            # Test with a fresh connection and keep it open for later sends
+            self._close_smtp()
+            self._get_smtp()
             
             messagebox.showinfo("Connection Test", "Email connection successful!")
             
@@ -947,6 +1390,45 @@ Other providers:
         except Exception as e:
             messagebox.showerror("Connection Error", f"Email connection failed: {e}")
             
+    def _get_smtp(self):
+        """Return a logged-in SMTP connection, reusing the open one if settings are unchanged."""
+        settings = (self.smtp_server_var.get().strip(), int(self.smtp_port_var.get().strip()),
+                    self.email_var.get().strip(), self.password_var.get().strip())
+        if self._smtp is not None and settings == self._smtp_settings:
+            return self._smtp
+            
+        self._close_smtp()
+        server_name, port, email, password = settings
+        server = smtplib.SMTP(server_name, port)
+        try:
+            server.starttls()
+            server.login(email, password)
+        except Exception:
+            server.close()
+            raise
+        self._smtp = server
+        self._smtp_settings = settings
+        return server
+        
+    def _close_smtp(self):
+        """Close the cached SMTP connection, if any."""
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except (smtplib.SMTPException, OSError):
+            self._smtp.close()
+        self._smtp = None
+        self._smtp_settings = None
+        
+    def destroy(self):
+        for after_id in self._background_polls.values():
+            self.after_cancel(after_id)
+        self._background_polls.clear()
+        self._io_pool.shutdown(wait=False)
+        self._close_smtp()
+        super().destroy()
+        
     def add_email_recipient(self):
         """Add an email recipient."""
         email = self.recipient_email_var.get().strip()
@@ -957,7 +1439,7 @@ Other providers:
             return
             
         # Check for valid email format
-        if "@" not in email or "." not in email:
+        if not _EMAIL_RE.match(email):
             messagebox.showwarning("Invalid Email", "Please enter a valid email address.")
             return
             
@@ -982,11 +1464,8 @@ Other providers:
             return
             
         # Generate iCal content for the team
-        schedule_data = getattr(self.main_app, 'schedule_data', [])
-        if hasattr(self.main_app, 'main_ui') and hasattr(self.main_app.main_ui, 'get_schedule_data'):
-            schedule_data = self.main_app.main_ui.get_schedule_data()
-            
-        team_events = [event for event in schedule_data if event.get("team") == team_name]
+        schedule_data = self._get_schedule_data()
+        team_events = self.web_manager.events_by_team(schedule_data).get(team_name)
         
         if not team_events:
             messagebox.showwarning("No Events", f"No events found for team {team_name}.")
@@ -1004,83 +1483,27 @@ Other providers:
         
     def generate_ical_file(self, events, filename, calendar_name):
         """Generate iCal file from events."""
-        ical_content = [
-            "BEGIN:VCALENDAR",
-            "VERSION:2.0",
-            "PRODID:-//Hockey Scheduler//Team Schedule//EN",
-            f"X-WR-CALNAME:{calendar_name} Hockey Schedule",
-            f"X-WR-CALDESC:Hockey schedule for {calendar_name}"
-        ]
-        
-        for event in events:
-            date_str = event.get("date", "")
-            time_slot = event.get("time_slot", "")
-            arena = event.get("arena", "")
-            opponent = event.get("opponent", "Practice")
-            event_type = event.get("type", "practice")
-            team = event.get("team", "")
+        ical_data = self.web_manager.cached_ical(events, calendar_name)
+        if ical_data is not None:
+            with open(filename, 'wb') as f:
+                f.write(ical_data)
+            return
             
-            if date_str and time_slot and "-" in time_slot:
-                try:
-                    # Parse date and time
-                    if isinstance(date_str, str):
-                        event_date = datetime.datetime.strptime(date_str, "%Y-%m-%d").date()
-                    else:
-                        event_date = date_str
-                        
-                    start_time_str, end_time_str = time_slot.split("-")
-                    start_time = datetime.datetime.strptime(start_time_str.strip(), "%H:%M").time()
-                    end_time = datetime.datetime.strptime(end_time_str.strip(), "%H:%M").time()
-                    
-                    # Create datetime objects
-                    start_datetime = datetime.datetime.combine(event_date, start_time)
-                    end_datetime = datetime.datetime.combine(event_date, end_time)
-                    
-                    # Format for iCal
-                    start_ical = start_datetime.strftime("%Y%m%dT%H%M%S")
-                    end_ical = end_datetime.strftime("%Y%m%dT%H%M%S")
-                    
-                    # Create unique ID
-                    uid = f"{team}-{date_str}-{start_time_str}@hockeyscheduler.local"
-                    
-                    # Determine event title
-                    if opponent == "Practice":
-                        title = f"{team} Practice"
-                    else:
-                        title = f"{team} vs {opponent}"
-                    
-                    ical_content.extend([
-                        "BEGIN:VEVENT",
-                        f"UID:{uid}",
-                        f"DTSTART:{start_ical}",
-                        f"DTEND:{end_ical}",
-                        f"SUMMARY:{title}",
-                        f"LOCATION:{arena}",
-                        f"DESCRIPTION:Type: {event_type}",
-                        "END:VEVENT"
-                    ])
-                    
-                except ValueError:
-                    continue  # Skip invalid events
-        
-        ical_content.append("END:VCALENDAR")
-        
-        # Write to file
-        with open(filename, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(ical_content))
+        # Stream to the file instead of building the whole calendar in memory
+        with open(filename, 'w', encoding='utf-8', newline='') as f:
+            f.writelines(self.web_manager.iter_ical(events, calendar_name))
             
     def export_all_calendars(self):
         """Export calendars for all teams."""
-        schedule_data = getattr(self.main_app, 'schedule_data', [])
-        if hasattr(self.main_app, 'main_ui') and hasattr(self.main_app.main_ui, 'get_schedule_data'):
-            schedule_data = self.main_app.main_ui.get_schedule_data()
-            
+        schedule_data = self._get_schedule_data()
+        
         if not schedule_data:
             messagebox.showwarning("No Data", "No schedule data available to export.")
             return
             
-        # Get all unique teams
-        teams = sorted(set(event.get("team", "") for event in schedule_data if event.get("team")))
+        # Group events by team in a single pass
+        by_team = self.web_manager.events_by_team(schedule_data)
+        teams = sorted(by_team)
         
         if not teams:
             messagebox.showwarning("No Teams", "No teams found in schedule data.")
@@ -1091,18 +1514,29 @@ Other providers:
         if not directory:
             return
             
-        exported_count = 0
-        for team_name in teams:
-            team_events = [event for event in schedule_data if event.get("team") == team_name]
-            if team_events:
+        def work():
+            exported_count = 0
+            failures = []
+            for team_name in teams:
                 filename = os.path.join(directory, f"{team_name}_schedule.ics")
                 try:
-                    self.generate_ical_file(team_events, filename, team_name)
+                    self.generate_ical_file(by_team[team_name], filename, team_name)
                     exported_count += 1
                 except Exception as e:
-                    messagebox.showerror("Export Error", f"Failed to export calendar for {team_name}: {e}")
-                    
-        messagebox.showinfo("Export Complete", f"Exported {exported_count} team calendars to {directory}")
+                    failures.append((team_name, e))
+            return exported_count, failures
+            
+        def done(future):
+            exported_count, failures = future.result()
+            if failures:
+                # One summary rather than a dialog per failed team
+                details = "\n".join(f"{team_name}: {e}" for team_name, e in failures)
+                messagebox.showerror("Export Errors", f"Exported {exported_count} team calendars to {directory}\n\n"
+                                     f"Failed to export {len(failures)}:\n{details}")
+            else:
+                messagebox.showinfo("Export Complete", f"Exported {exported_count} team calendars to {directory}")
+            
+        self._run_in_background(work, done)
         
     def generate_mobile_schedule(self):
         """Generate mobile-optimized schedule."""
@@ -1132,25 +1566,29 @@ Other providers:
             return False
             
         try:
-            import smtplib
-            from email.mime.text import MimeText
-            from email.mime.multipart import MimeMultipart
+            server = self._get_smtp()
             
-            server = smtplib.SMTP(self.smtp_server_var.get(), int(self.smtp_port_var.get()))
-            server.starttls()
-            server.login(self.email_var.get(), self.password_var.get())
+            # Build and serialize the message once; recipients only go in the
+            # envelope (BCC) so league addresses are not disclosed to each other
+            sender = self.email_var.get().strip()
+            msg = EmailMessage()
+            msg['From'] = sender
+            msg['To'] = sender
+            msg['Subject'] = subject
+            msg.set_content(message)
+            raw = msg.as_bytes()
             
-            for recipient in recipients:
-                msg = MimeMultipart()
-                msg['From'] = self.email_var.get()
-                msg['To'] = recipient
-                msg['Subject'] = subject
-                
-                msg.attach(MimeText(message, 'plain'))
+            try:
+                refused = server.sendmail(sender, recipients, raw)
+            except smtplib.SMTPServerDisconnected:
+                # The server dropped the idle connection; reconnect once
+                self._close_smtp()
+                server = self._get_smtp()
+                refused = server.sendmail(sender, recipients, raw)
                 
-                server.send_message(msg)
+            if refused:
+                messagebox.showwarning("Email Warning", "Some recipients were rejected:\n" + "\n".join(refused))
             
-            server.quit()
             return True
             
         except Exception as e: